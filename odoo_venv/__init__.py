@@ -1,3 +1,11 @@
-from .main import create_odoo_venv
-
 __all__ = ["create_odoo_venv"]
+
+
+def __getattr__(name: str):
+    # Resolve lazily: importing odoo_venv.main pulls in typer and packaging,
+    # which CLI entry points like `odoo-venv --version` don't need.
+    if name == "create_odoo_venv":
+        from .main import create_odoo_venv
+
+        return create_odoo_venv
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")  # noqa: TRY003
@@ -0,0 +1,21 @@
+import sys
+
+
+def run() -> None:
+    """Console entry point for ``odoo-venv``.
+
+    Not named ``main``: importing the ``odoo_venv.cli.main`` submodule would rebind that
+    package attribute to the module.
+
+    ``odoo-venv --version`` is answered before Typer and the CLI module are imported;
+    every other invocation is handed to the Typer app.
+    """
+    if sys.argv[1:] in (["-V"], ["--version"]):
+        from importlib.metadata import version
+
+        print(f"odoo-venv {version('odoo-venv')}")
+        return
+
+    from odoo_venv.cli.main import app
+
+    app()
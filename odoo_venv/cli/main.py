@@ -1,32 +1,21 @@
-import ast
-import concurrent.futures
 import json
 import os
-import re
 import shutil
 import subprocess
 import sys
-import urllib.request
-from dataclasses import asdict
-from importlib.metadata import version
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 from typing import Annotated
 
 import typer
-from odoo_addons_path import (
-    detect_codebase_layout,
-    get_addons_path,
-    get_odoo_version_from_release,
-)
-from rich.console import Console
-from rich.table import Table
 
 from odoo_venv.exceptions import PresetNotFoundError
-from odoo_venv.launcher import create_launcher
-from odoo_venv.main import _resolve_manifest_dep, create_odoo_venv
 from odoo_venv.utils import (
+    PRESET_FIELD_NAMES,
     VENV_CONFIG_FILENAME,
     load_presets,
+    parse_requirements_text,
     read_venv_config,
     split_escaped,
     write_venv_config,
@@ -36,7 +25,7 @@ app = typer.Typer()
 # we use same python versions as OCA: https://github.com/oca/oca-ci/blob/master/.github/workflows/ci.yaml
 # with some adjustments based on our experience
 # we don't define a specific minor version here, but can be done via --python-version=
-ODOO_PYTHON_VERSIONS = {
+ODOO_PYTHON_VERSIONS = MappingProxyType({
     "12.0": "3.7",  # faced issues with gevent and python 3.6
     "13.0": "3.7",
     "14.0": "3.8",
@@ -45,7 +34,11 @@ ODOO_PYTHON_VERSIONS = {
     "17.0": "3.10",
     "18.0": "3.10",
     "19.0": "3.10",
-}
+})
+
+# Option metadata shared by several commands; defined once so every command reuses
+# the same OptionInfo instead of repeating (and risking drift in) the help text.
+AddonsPathOption = Annotated[str | None, typer.Option(help="Comma-separated list of addons paths.")]
 
 
 _IGNORE_PARAM_NAMES = (
@@ -55,6 +48,24 @@ _IGNORE_PARAM_NAMES = (
 )
 
 
+@lru_cache(maxsize=1)
+def _tool_version() -> str:
+    """Installed odoo-venv version; the metadata lookup scans sys.path, so it is done once."""
+    from importlib.metadata import version
+
+    return version("odoo-venv")
+
+
+def _resolve_path(path: str) -> str:
+    """Return the absolute, symlink-free form of *path*, like ``Path(path).expanduser().resolve()``."""
+    return os.path.realpath(os.path.expanduser(path))
+
+
+def _resolve_addons_path(value: str) -> list[str]:
+    """Split a comma-separated addons path and resolve each entry with :func:`_resolve_path`."""
+    return [_resolve_path(p.strip()) for p in value.split(",")]
+
+
 def _normalize_pkg_name(pkg: str) -> str:
     """Normalize a package name to match how create_odoo_venv normalizes ignore names."""
     from packaging.requirements import InvalidRequirement, Requirement
@@ -107,9 +118,9 @@ def _build_ignore_sources_from_config(config: dict[str, str | bool]) -> dict[str
     if preset_name:
         all_presets = load_presets()
         if preset_name in all_presets:
-            preset_data = asdict(all_presets[preset_name])
+            preset_vals = all_presets[preset_name]
             for param_name in _IGNORE_PARAM_NAMES:
-                val = preset_data.get(param_name, "") or ""
+                val = getattr(preset_vals, param_name) or ""
                 preset_ignores[param_name] = set(_split_ignore_packages(val))
 
     sources: dict[str, str] = {}
@@ -124,6 +135,16 @@ def _build_ignore_sources_from_config(config: dict[str, str | bool]) -> dict[str
     return sources
 
 
+def _ctx_obj(ctx: typer.Context) -> dict:
+    """Return ``ctx.obj``, initialising it to an empty dict on first use.
+
+    Cheaper than ``ctx.ensure_object(dict)``, which walks the context chain on every call.
+    """
+    if ctx.obj is None:
+        ctx.obj = {}
+    return ctx.obj
+
+
 def _apply_preset(ctx: typer.Context, preset_name: str, all_presets: dict, *, silent: bool = False):
     """Apply a preset's options to the Typer context.
 
@@ -137,7 +158,9 @@ def _apply_preset(ctx: typer.Context, preset_name: str, all_presets: dict, *, si
         silent: When True, suppress the "Applying preset" message.
     """
     preset_vals = all_presets[preset_name]
-    preset_options = asdict(preset_vals)
+    # Shallow read of the fields: asdict() would deep-copy extra_commands for nothing,
+    # since everything below only reads the values.
+    preset_options = {name: getattr(preset_vals, name) for name in PRESET_FIELD_NAMES}
 
     ctx.default_map = ctx.default_map or {}
     ctx.default_map.update(preset_options)
@@ -146,7 +169,7 @@ def _apply_preset(ctx: typer.Context, preset_name: str, all_presets: dict, *, si
     # Remove them from default_map so Click doesn't double-apply them.
     ctx.default_map.pop("extra_commands", None)
     ctx.default_map.pop("extra_requirement", None)
-    obj = ctx.ensure_object(dict)
+    obj = _ctx_obj(ctx)
     obj["extra_commands"] = preset_options.get("extra_commands")
     obj["preset_extra_requirement"] = preset_options.get("extra_requirement")
 
@@ -158,7 +181,7 @@ def preset_callback(ctx: typer.Context, param: typer.CallbackParam, value: str):
     all_presets = load_presets()
 
     if not value:
-        obj = ctx.ensure_object(dict)
+        obj = _ctx_obj(ctx)
         if not obj.get("project_dir") and "common" in all_presets:
             _apply_preset(ctx, "common", all_presets)
         return None
@@ -167,7 +190,7 @@ def preset_callback(ctx: typer.Context, param: typer.CallbackParam, value: str):
         raise PresetNotFoundError(value)
 
     _apply_preset(ctx, value, all_presets)
-    ctx.ensure_object(dict)["explicit_preset"] = True
+    _ctx_obj(ctx)["explicit_preset"] = True
     return value
 
 
@@ -181,7 +204,7 @@ def project_dir_callback(ctx: typer.Context, param: typer.CallbackParam, value:
     # --preset appears before --project-dir in argv) to skip the auto-apply in that case.
     # When --project-dir appears first, we apply "project" defaults silently here; if the
     # user also passed --preset, that callback fires next and will overwrite with its message.
-    obj = ctx.ensure_object(dict)
+    obj = _ctx_obj(ctx)
     if not obj.get("explicit_preset"):
         all_presets = load_presets()
         if "project" in all_presets:
@@ -224,7 +247,7 @@ def from_config_callback(ctx: typer.Context, param: typer.CallbackParam, value:
 
 def version_callback(value: bool):
     if value:
-        typer.echo(f"odoo-venv {version('odoo-venv')}")
+        typer.echo(f"odoo-venv {_tool_version()}")
         raise typer.Exit()
 
 
@@ -244,17 +267,14 @@ def main_callback(
     pass
 
 
-def _build_extra_requirements(ctx: typer.Context, extra_requirement: str | tuple | None) -> list[str]:
+def _build_extra_requirements(ctx: typer.Context, extra_requirement: str | None) -> list[str]:
     """Merge preset's extra_requirement with any explicit CLI value."""
     result = []
     preset_extra_req = (ctx.obj or {}).get("preset_extra_requirement")
     if preset_extra_req:
         result.extend(split_escaped(preset_extra_req))
     if extra_requirement:
-        if isinstance(extra_requirement, str):
-            result.extend(split_escaped(extra_requirement))
-        else:
-            result.extend(extra_requirement)
+        result.extend(split_escaped(extra_requirement))
     return result
 
 
@@ -264,6 +284,8 @@ def _detect_project_layout(project_dir_value: str) -> tuple[Path | None, str | N
     Returns:
         (odoo_dir_path, odoo_version, addons_path) — any value may be None if not detected.
     """
+    from odoo_addons_path import detect_codebase_layout, get_addons_path, get_odoo_version_from_release
+
     project_dir_path = Path(project_dir_value).expanduser().resolve()
     detected_paths = detect_codebase_layout(project_dir_path)
 
@@ -293,8 +315,10 @@ def _resolve_odoo_dir_and_version(
     The version is always inferred from the Odoo source (release.py).
     Exits with an error if odoo_dir cannot be resolved or version cannot be detected.
     """
+    from odoo_addons_path import get_odoo_version_from_release
+
     if odoo_dir:
-        odoo_dir_path = Path(odoo_dir).expanduser().resolve()
+        odoo_dir_path = Path(_resolve_path(odoo_dir))
     elif detected_odoo_dir:
         odoo_dir_path = detected_odoo_dir
     else:
@@ -395,10 +419,7 @@ def create(
     ] = None,
     venv_dir: Annotated[str, typer.Option(help="Path to create the virtual environment.")] = "./.venv",
     odoo_dir: Annotated[str | None, typer.Option(help="Path to Odoo source code.")] = None,
-    addons_path: Annotated[
-        str | None,
-        typer.Option(help="Comma-separated list of addons paths."),
-    ] = None,
+    addons_path: AddonsPathOption = None,
     install_odoo: Annotated[
         bool,
         typer.Option(
@@ -504,12 +525,17 @@ def create(
     ] = False,
 ):
     """Create virtual environment to run Odoo"""
+    # Heavy imports are deferred so that `--help`, `--version` and the other
+    # subcommands don't pay for the packaging/odoo-addons-path import graph.
+    from odoo_venv.launcher import create_launcher
+    from odoo_venv.main import create_odoo_venv
+
     if report_errors:
         _run_with_error_reporting(sys.argv)
         return
 
     # Auto-detect layout from --project-dir if provided
-    project_dir_value = ctx.obj.get("project_dir") if ctx.obj else None
+    project_dir_value = (ctx.obj or {}).get("project_dir")
     detected_odoo_dir, detected_version, detected_addons_path = (
         _detect_project_layout(project_dir_value) if project_dir_value else (None, None, None)
     )
@@ -524,8 +550,6 @@ def create(
     if not python_version:
         python_version = ODOO_PYTHON_VERSIONS.get(odoo_version)
 
-    venv_dir_path = Path(venv_dir).expanduser().resolve()
-
     # Merge preset's extra_requirement (stored in ctx.obj) with any explicit CLI value.
     # The CLI value is additive: --extra-requirement="" means "nothing extra beyond the preset".
     extra_requirements_list = _build_extra_requirements(ctx, extra_requirement)
@@ -533,12 +557,10 @@ def create(
     if not addons_path and detected_addons_path:
         addons_path = detected_addons_path
 
-    addons_path_list = (
-        [str(Path(p.strip()).expanduser().resolve()) for p in addons_path.split(",")] if addons_path else None
-    )
+    addons_path_list = _resolve_addons_path(addons_path) if addons_path else None
 
     # Get extra_commands from preset if available
-    extra_commands = ctx.obj.get("extra_commands") if ctx.obj else None
+    extra_commands = (ctx.obj or {}).get("extra_commands")
 
     # Build ignore_sources: map each ignored package to its source tag
     ignore_sources = _build_ignore_sources(
@@ -573,6 +595,9 @@ def create(
         ignore_sources=ignore_sources,
     )
 
+    # Only resolved once the venv exists: nothing before this point needs the absolute path.
+    venv_dir_path = Path(_resolve_path(venv_dir))
+
     if create_launcher_flag:
         create_launcher(odoo_version, venv_dir_path, odoo_dir=odoo_dir_path, force=True)
 
@@ -606,7 +631,7 @@ def create(
         venv_dir_path,
         config_args,
         odoo_version,
-        tool_version=version("odoo-venv"),
+        tool_version=_tool_version(),
         requirements=result.requirements or None,
         ignored=result.ignored or None,
     )
@@ -634,13 +659,7 @@ def _freeze_venv(venv_dir: Path) -> dict[str, str]:
         cmd = [str(venv_dir / "bin" / "pip"), "freeze", "--all"]
 
     result = subprocess.run(cmd, capture_output=True, text=True, check=True)  # noqa: S603
-    pkgs: dict[str, str] = {}
-    for line in result.stdout.splitlines():
-        line = line.strip()
-        if "==" in line:
-            name, ver = line.split("==", 1)
-            pkgs[re.sub(r"[-_.]+", "-", name).lower()] = ver
-    return pkgs
+    return parse_requirements_text(result.stdout)
 
 
 SKIP_DIRS = {".git", "node_modules", "__pycache__", ".tox", ".nox", ".mypy_cache", ".ruff_cache"}
@@ -690,29 +709,12 @@ def _freeze_remote_venv(host: str, remote_path: str) -> dict[str, str]:
         text=True,
         check=True,
     )
-    pkgs: dict[str, str] = {}
-    for line in result.stdout.splitlines():
-        line = line.strip()
-        if "==" in line:
-            name, ver = line.split("==", 1)
-            pkgs[re.sub(r"[-_.]+", "-", name).lower()] = ver
-    return pkgs
-
-
-def _parse_requirements_text(text: str) -> dict[str, str]:
-    """Parse pip-freeze-style text into a ``{normalized_name: version}`` dict."""
-    pkgs: dict[str, str] = {}
-    for line in text.splitlines():
-        line = line.strip()
-        if line and not line.startswith("#") and "==" in line:
-            name, ver = line.split("==", 1)
-            pkgs[re.sub(r"[-_.]+", "-", name).lower()] = ver
-    return pkgs
+    return parse_requirements_text(result.stdout)
 
 
 def _read_requirements_file(path: Path) -> dict[str, str]:
     """Read a local pip-freeze-style requirements file."""
-    return _parse_requirements_text(path.read_text())
+    return parse_requirements_text(path.read_text())
 
 
 def _read_remote_requirements_file(host: str, remote_path: str) -> dict[str, str]:
@@ -723,7 +725,7 @@ def _read_remote_requirements_file(host: str, remote_path: str) -> dict[str, str
         text=True,
         check=True,
     )
-    return _parse_requirements_text(result.stdout)
+    return parse_requirements_text(result.stdout)
 
 
 def _detect_remote_kind(host: str, remote_path: str) -> str:
@@ -832,6 +834,8 @@ def _collect_python_versions(parsed: list[tuple[str | None, str, str]], labels:
 
 def _fetch_latest_pypi(package: str) -> str:
     """Return the latest version of *package* from PyPI, or ``"?"`` on failure."""
+    import urllib.request
+
     url = f"https://pypi.org/pypi/{package}/json"
     try:
         with urllib.request.urlopen(url, timeout=5) as resp:  # noqa: S310
@@ -985,6 +989,8 @@ def compare(
         odoo-venv compare .venv staging-host:~/.venvs/odoo18
         odoo-venv compare .venv staging-host:~/.venvs/odoo18 ~/freeze.txt
     """
+    import concurrent.futures
+
     from rich.console import Console
 
     if not venv_dirs:
@@ -1037,6 +1043,8 @@ def create_odoo_launcher(
     force: Annotated[bool, typer.Option(help="Overwrite existing launcher script.")] = False,
 ):
     """Generate a launcher script in ~/.local/bin/ for the Odoo environment"""
+    from odoo_venv.launcher import create_launcher
+
     venv_dir_path = Path(venv_dir).expanduser().resolve()
     odoo_dir_path = Path(odoo_dir).expanduser().resolve() if odoo_dir else None
     create_launcher(odoo_version, venv_dir_path, odoo_dir=odoo_dir_path, force=force)
@@ -1044,21 +1052,19 @@ def create_odoo_launcher(
 
 def _build_update_venv(merged: dict, odoo_version: str, venv_path: Path):
     """Create a venv from merged config. Returns VenvResult."""
+    from odoo_venv.main import create_odoo_venv
+
     # Resolve preset's extra_commands if a preset is set
     extra_commands = None
     merged_preset = merged.get("preset")
     if merged_preset:
         all_presets = load_presets()
         if merged_preset in all_presets:
-            extra_commands = asdict(all_presets[merged_preset]).get("extra_commands")
+            extra_commands = all_presets[merged_preset].extra_commands
 
     # Build addons_paths list
     addons_path_value = merged.get("addons_path", "")
-    addons_paths_list = (
-        [str(Path(p.strip()).expanduser().resolve()) for p in addons_path_value.split(",")]
-        if addons_path_value
-        else None
-    )
+    addons_paths_list = _resolve_addons_path(addons_path_value) if addons_path_value else None
 
     # Build extra_requirements list
     extra_req_str = merged.get("extra_requirement", "")
@@ -1111,6 +1117,7 @@ def update(
     ] = False,
 ):
     """Update an existing venv by rebuilding from its .odoo-venv.toml configuration."""
+    from rich.console import Console
 
     venv_path = Path(venv_dir).expanduser().resolve()
     if not venv_path.is_dir():
@@ -1142,7 +1149,7 @@ def update(
             venv_path,
             toml_args,
             odoo_version_val,
-            tool_version=version("odoo-venv"),
+            tool_version=_tool_version(),
             requirements=result.requirements or None,
             ignored=result.ignored or None,
         )
@@ -1425,19 +1432,21 @@ def _find_module_manifests(module_names: list[str] | None, addons_path_list: lis
 
     When *module_names* is None, all modules with a manifest are included.
     """
+    wanted = set(module_names) if module_names is not None else None
     found: dict[str, Path] = {}
     for addons_dir in addons_path_list:
-        addons_dir_path = Path(addons_dir)
-        if not addons_dir_path.is_dir():
+        try:
+            with os.scandir(addons_dir) as it:
+                entries = list(it)
+        except OSError:
             continue
-        for module_dir in addons_dir_path.iterdir():
-            if not module_dir.is_dir() or module_dir.name in found:
+        for entry in entries:
+            if entry.name in found or (wanted is not None and entry.name not in wanted):
                 continue
-            if module_names is not None and module_dir.name not in module_names:
-                continue
-            manifest_path = module_dir / "__manifest__.py"
-            if manifest_path.is_file():
-                found[module_dir.name] = manifest_path
+            # Filter on the name first: is_dir() and the manifest check may each cost a stat.
+            manifest_path = os.path.join(entry.path, "__manifest__.py")
+            if entry.is_dir() and os.path.isfile(manifest_path):
+                found[entry.name] = Path(manifest_path)
     return found
 
 
@@ -1445,18 +1454,28 @@ def _collect_external_deps_from_manifests(
     found: dict[str, Path], kind: str, show_paths: bool = False, project_dir: str | None = None
 ) -> dict[str, list[str]]:
     """Return {dep: [module_name_or_path, ...]} for the given dependency kind from a set of manifest files."""
-    base = Path(project_dir).expanduser().resolve() if project_dir else Path.cwd()
+    from concurrent.futures import ThreadPoolExecutor
+
+    from odoo_venv.main import _IO_WORKERS, _read_manifest_external_dependencies, _resolve_manifest_dep
+
+    base = None
+    if show_paths:
+        base = Path(project_dir).expanduser().resolve() if project_dir else Path.cwd()
+    # Manifests are read and parsed in parallel; map() keeps them in module order.
+    ext_deps_list: list[dict] = []
+    if found:
+        with ThreadPoolExecutor(max_workers=min(_IO_WORKERS, len(found))) as executor:
+            ext_deps_list = list(executor.map(_read_manifest_external_dependencies, found.values()))
     result: dict[str, list[str]] = {}
-    for module_name, manifest_path in found.items():
-        if show_paths:
+    for (module_name, manifest_path), ext_deps in zip(found.items(), ext_deps_list, strict=True):
+        if base is not None:
             try:
                 label = str(manifest_path.parent.relative_to(base))
             except ValueError:
                 label = str(manifest_path.parent)
         else:
             label = module_name
-        manifest = ast.literal_eval(manifest_path.read_text(encoding="utf-8"))
-        deps = manifest.get("external_dependencies", {}).get(kind, [])
+        deps = ext_deps.get(kind, [])
         if isinstance(deps, list):
             for dep in deps:
                 entry = _resolve_manifest_dep(dep) if kind == "python" else dep
@@ -1492,10 +1511,7 @@ def list_external_dependencies(
             help="Comma-separated list of module names. Defaults to all modules found in the addons path.",
         ),
     ] = None,
-    addons_path: Annotated[
-        str | None,
-        typer.Option(help="Comma-separated list of addons paths."),
-    ] = None,
+    addons_path: AddonsPathOption = None,
     project_dir: Annotated[
         str | None,
         typer.Option("--project-dir", help="Project directory to auto-detect addons paths from."),
@@ -1519,6 +1535,7 @@ def list_external_dependencies(
 ):
     """List external dependencies for a set of Odoo modules based on their manifests."""
     from rich import box
+    from rich.console import Console
     from rich.table import Table
 
     if output not in ("table", "raw"):
@@ -1536,7 +1553,7 @@ def list_external_dependencies(
         typer.secho("error: could not determine addons path.", fg=typer.colors.RED)
         raise typer.Exit(1)
 
-    addons_path_list = [str(Path(p.strip()).expanduser().resolve()) for p in addons_path.split(",")]
+    addons_path_list = _resolve_addons_path(addons_path)
     module_names = [m.strip() for m in modules.split(",") if m.strip()] if modules else None
 
     found = _find_module_manifests(module_names, addons_path_list)
@@ -1567,6 +1584,8 @@ def list_external_dependencies(
 @app.command("list")
 def list_venvs():
     """List virtual environments found under the current directory."""
+    from rich.console import Console
+    from rich.table import Table
 
     root = Path.cwd()
     venvs = _discover_venvs(root)
@@ -1,5 +1,6 @@
 """Standalone CLI entry point for the `ovx` command."""
 
+import os
 from pathlib import Path
 from typing import Annotated
 
@@ -67,7 +68,7 @@ def main(
 
     extra_addons: list[str] = []
     if addons_path:
-        extra_addons = [str(Path(p.strip()).expanduser().resolve()) for p in addons_path.split(",") if p.strip()]
+        extra_addons = [os.path.realpath(os.path.expanduser(p.strip())) for p in addons_path.split(",") if p.strip()]
     try:
         rc = run_ovx(
             resolved_paths,
@@ -2,6 +2,8 @@
 
 import os
 import sys
+from functools import lru_cache
+from importlib.resources import files
 from pathlib import Path
 from string import Template
 
@@ -9,7 +11,17 @@ import typer
 from odoo_addons_path import get_odoo_version
 
 LAUNCHER_DIR = Path("~/.local/bin").expanduser()
-TEMPLATE_PATH = Path(__file__).parent / "assets" / "launcher.sh.template"
+_LAUNCHER_DIR_STR = os.path.normpath(LAUNCHER_DIR)
+# Package resource rather than a __file__-relative path, so it also loads from zipped installs.
+TEMPLATE_PATH = files("odoo_venv") / "assets" / "launcher.sh.template"
+# Styled once; echo() still strips the ANSI codes when stdout is not a terminal.
+_GREEN_CHECK = typer.style("✓ Launcher created:", fg=typer.colors.GREEN)
+
+
+@lru_cache(maxsize=1)
+def _template() -> Template:
+    """Read and compile the launcher template once per process."""
+    return Template(TEMPLATE_PATH.read_bytes().decode("utf-8"))
 
 
 def _resolve_major_version(odoo_version: str, odoo_dir: Path | None) -> str:
@@ -37,6 +49,19 @@ def _resolve_major_version(odoo_version: str, odoo_dir: Path | None) -> str:
     sys.exit(1)
 
 
+def _launcher_dir_on_path() -> bool:
+    """Whether ``LAUNCHER_DIR`` is one of the ``$PATH`` entries.
+
+    Whole entries are compared (a substring test would accept e.g. ``~/.local/bin2``),
+    after expanding ``~`` and normalising, so ``~/.local/bin/`` also counts.
+    """
+    return any(
+        os.path.normpath(os.path.expanduser(entry)) == _LAUNCHER_DIR_STR
+        for entry in os.environ.get("PATH", "").split(os.pathsep)
+        if entry
+    )
+
+
 def create_launcher(
     odoo_version: str, venv_dir: str | Path, *, odoo_dir: Path | None = None, force: bool = False
 ) -> Path:
@@ -75,8 +100,7 @@ def create_launcher(
 
     # Read and render template
     try:
-        template_content = TEMPLATE_PATH.read_text()
-        rendered = Template(template_content).substitute(VENV_DIR=str(venv_path))
+        rendered = _template().substitute(VENV_DIR=str(venv_path))
     except FileNotFoundError:
         typer.secho(f"Template not found: {TEMPLATE_PATH}", fg=typer.colors.RED, err=True)
         sys.exit(1)
@@ -106,7 +130,7 @@ def create_launcher(
         sys.exit(1)
 
     # Check if launcher dir is in PATH
-    if str(LAUNCHER_DIR) not in os.environ.get("PATH", ""):
+    if not _launcher_dir_on_path():
         typer.secho(
             f"\nWarning: {LAUNCHER_DIR} is not in your PATH.\n"
             f"Add this to your shell profile (~/.bashrc or ~/.zshrc):\n"
@@ -114,5 +138,5 @@ def create_launcher(
             fg=typer.colors.YELLOW,
         )
 
-    typer.secho(f"✓ Launcher created: {output_path}", fg=typer.colors.GREEN)
+    typer.echo(f"{_GREEN_CHECK} {output_path}")
     return output_path
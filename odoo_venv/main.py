@@ -2,19 +2,25 @@ import ast
 import operator
 import os
 import re
+import string
 import subprocess
 import sys
-import tempfile
 from collections import defaultdict
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import cache, lru_cache
 from pathlib import Path
 
 import typer
 from packaging.markers import Marker, default_environment
 from packaging.requirements import InvalidRequirement, Requirement
+from packaging.specifiers import SpecifierSet
+from packaging.version import InvalidVersion, Version
 from packaging.version import parse as parse_version
 
+from odoo_venv.utils import parse_requirements_text
+
 
 @dataclass
 class VenvResult:
@@ -24,7 +30,18 @@ class VenvResult:
     ignored: dict[str, list[str]] = field(default_factory=dict)
 
 
-PKG_NAME_PATTERN = re.compile(r"(?P<lib_name>[a-z0-9A-Z\-\_\.]+)((>|<|=)=)?(.*)")
+# Characters allowed in a package name (ASCII letters, digits, ``-``, ``_`` and ``.``),
+# for the regex-free scan in _extract_pkg_name().
+_PKG_NAME_CHARS = string.ascii_letters + string.digits + "-_."
+
+# Matched against the raw bytes of odoo/__init__.py, which never needs decoding.
+_MIN_PY_VERSION_RE = re.compile(rb"MIN_PY_VERSION\s*=\s*\((\d+),\s*(\d+)\)")
+
+# variable OP 'value', as accepted by _evaluate_version_expr
+_VERSION_EXPR_RE = re.compile(r"(\w+)\s*(<=|>=|<|>|==|!=)\s*['\"]([^'\"]+)['\"]")
+
+# Thread pool size for the I/O-bound manifest discovery and reading steps.
+_IO_WORKERS = min(32, (os.cpu_count() or 1) * 4)
 
 VALID_STAGES = {"after_venv", "after_requirements", "after_odoo_install"}
 
@@ -70,6 +87,54 @@ _COMPARISON_OPS = {
 }
 
 
+@cache
+def _cached_requirement(line: str) -> Requirement:
+    """Parse *line* as a PEP 508 requirement, memoized per distinct line.
+
+    The same lines recur across Odoo's requirements.txt, addons requirements and manifest
+    ``external_dependencies``, and are parsed again by every collector pass.  The returned
+    object is shared, so callers must treat it as read-only.
+    """
+    return Requirement(line)
+
+
+@lru_cache(maxsize=4096)
+def _normalize_pkg_name(name: str) -> str:
+    """Memoized PEP 503 name normalisation, the key of ``ignored_req_map`` and ``origins``.
+
+    >>> _normalize_pkg_name("Python_Stdnum")
+    'python-stdnum'
+    """
+    return re.sub(r"[-_.]+", "-", name.lower())
+
+
+@lru_cache(maxsize=4096)
+def _parse_ver(value: str) -> Version:
+    """Memoized :func:`packaging.version.parse`; the same few version strings are compared repeatedly."""
+    return parse_version(value)
+
+
+@lru_cache(maxsize=1024)
+def _cached_marker(marker_expr: str) -> Marker:
+    """Memoized :class:`packaging.markers.Marker` construction."""
+    return Marker(marker_expr)
+
+
+@lru_cache(maxsize=16)
+def _marker_environment(python_version: str | None) -> dict[str, str]:
+    """Return the PEP 508 marker environment, targeting *python_version* when given.
+
+    Built once per Python version rather than per marker evaluation.  The dict is
+    shared between callers and must be treated as read-only.
+    """
+    env = {k: str(v) for k, v in default_environment().items()}
+    if python_version:
+        env["python_version"] = ".".join(python_version.split(".")[:2])
+        env["python_full_version"] = python_version
+    return env
+
+
+@lru_cache(maxsize=1024)
 def _evaluate_marker(
     marker_expr: str,
     odoo_version: str,
@@ -83,23 +148,22 @@ def _evaluate_marker(
 
     Note: if *python_version* is None, marker evaluation uses the system
     Python version from ``packaging.markers.default_environment()``.
+
+    Results are memoized: the same ``(marker, odoo_version, python_version)``
+    triple is checked for every requirement line and extra command.
     """
     if not marker_expr:
         return True
 
-    env: dict[str, str] = {**default_environment()}
-    if python_version:
-        env["python_version"] = ".".join(python_version.split(".")[:2])
-        env["python_full_version"] = python_version
+    env = _marker_environment(python_version)
 
     if "odoo_version" not in marker_expr:
         try:
-            return Marker(marker_expr).evaluate(environment=env)
+            return _cached_marker(marker_expr).evaluate(environment=env)
         except Exception:
             return False
 
-    env["odoo_version"] = odoo_version
-    return _evaluate_version_expr(marker_expr, env)
+    return _evaluate_version_expr(marker_expr, {**env, "odoo_version": odoo_version})
 
 
 def _evaluate_version_expr(marker_expr: str, variables: dict[str, str]) -> bool:
@@ -108,30 +172,61 @@ def _evaluate_version_expr(marker_expr: str, variables: dict[str, str]) -> bool:
     Handles ``or`` (lower precedence) and ``and`` (higher precedence) boolean
     operators, and ``<``, ``<=``, ``>``, ``>=``, ``==``, ``!=`` on version-like
     values looked up from *variables*.
+
+    >>> _evaluate_version_expr("odoo_version >= '13.0' and odoo_version < '15.0'", {"odoo_version": "14.0"})
+    True
+    >>> _evaluate_version_expr("odoo_version == 'master' or odoo_version > '18.0'", {"odoo_version": "master"})
+    True
+    """
+    return _compile_version_expr(marker_expr)(variables)
+
+
+@lru_cache(maxsize=256)
+def _compile_version_expr(marker_expr: str) -> Callable[[dict[str, str]], bool]:
+    """Parse *marker_expr* once into a predicate over the variables dict.
+
+    The expression is split and its literal versions parsed at compile time, so
+    evaluating the same ``when`` marker again only looks up and compares values.
     """
     expr = marker_expr.strip()
 
-    # Split on 'or' first (lower precedence = outermost split)
-    if " or " in expr:
-        return any(_evaluate_version_expr(p.strip(), variables) for p in expr.split(" or "))
+    # Split on 'or' first (lower precedence = outermost split).  A single split() per level
+    # both detects and splits the operator, instead of an ``in`` scan followed by split().
+    parts = expr.split(" or ")
+    if len(parts) > 1:
+        any_of = tuple(_compile_version_expr(p) for p in parts)
+        return lambda variables: any(pred(variables) for pred in any_of)
 
-    if " and " in expr:
-        return all(_evaluate_version_expr(p.strip(), variables) for p in expr.split(" and "))
+    parts = expr.split(" and ")
+    if len(parts) > 1:
+        all_of = tuple(_compile_version_expr(p) for p in parts)
+        return lambda variables: all(pred(variables) for pred in all_of)
 
     # Parse: variable OP 'value'
-    match = re.match(r"(\w+)\s*(<=|>=|<|>|==|!=)\s*['\"]([^'\"]+)['\"]", expr)
+    match = _VERSION_EXPR_RE.match(expr)
     if not match:
-        return False
+        return lambda variables: False
 
     var_name, op_str, compare_value = match.groups()
-    actual_value = variables.get(var_name)
-    if actual_value is None:
-        return False
-
+    op = _COMPARISON_OPS[op_str]
     try:
-        return _COMPARISON_OPS[op_str](parse_version(actual_value), parse_version(compare_value))
-    except Exception:
-        return _COMPARISON_OPS[op_str](actual_value, compare_value)
+        compare_version = _parse_ver(compare_value)
+    except InvalidVersion:
+        compare_version = None
+
+    def _compare(variables: dict[str, str]) -> bool:
+        actual_value = variables.get(var_name)
+        if actual_value is None:
+            return False
+        # Non-version values (e.g. "master") fall back to plain string comparison.
+        if compare_version is not None:
+            try:
+                return op(_parse_ver(actual_value), compare_version)
+            except InvalidVersion:
+                pass
+        return op(actual_value, compare_value)
+
+    return _compare
 
 
 def _validate_cmd_spec(cmd_spec: dict, i: int, stage: str, is_first: bool) -> bool:
@@ -258,11 +353,11 @@ def _collect_constrained_packages(req_lines: list[str], target_env: dict[str, st
     """
     result = set()
     for line in req_lines:
-        line = line.split("#")[0].strip()
+        line = line.partition("#")[0].strip()
         if not line:
             continue
         try:
-            req = Requirement(line)
+            req = _cached_requirement(line)
             if req.specifier and (not req.marker or req.marker.evaluate(environment=target_env)):
                 result.add(req.name.lower())
         except InvalidRequirement:
@@ -283,11 +378,11 @@ def _collect_mentioned_packages(req_lines: list[str], target_env: dict[str, str]
     """
     result = set()
     for line in req_lines:
-        line = line.split("#")[0].strip()
+        line = line.partition("#")[0].strip()
         if not line:
             continue
         try:
-            req = Requirement(line)
+            req = _cached_requirement(line)
             if not req.marker or req.marker.evaluate(environment=target_env):
                 result.add(req.name.lower())
         except InvalidRequirement:
@@ -322,7 +417,7 @@ def _build_labeled_user_sources(
     install_addons_dirs_requirements: bool,
     addons_paths: list[str] | None,
     manifest_files: list[Path],
-    parsed_manifests: dict[Path, dict],
+    manifest_python_deps: dict[Path, list[str]],
 ) -> list[tuple[list[str], str]]:
     """Build (req_lines, label) pairs for each user requirement source."""
     result: list[tuple[list[str], str]] = []
@@ -331,16 +426,15 @@ def _build_labeled_user_sources(
     if extra_requirements_file:
         path = Path(extra_requirements_file).expanduser().resolve()
         if path.exists():
-            result.append((path.read_text(encoding="utf-8").splitlines(), f"--extra-requirements-file ({path.name})"))
+            result.append((_read_requirement_lines(path), f"--extra-requirements-file ({path.name})"))
     if install_addons_dirs_requirements and addons_paths:
         for p in addons_paths:
             req_file = Path(p) / "requirements.txt"
             if req_file.exists():
-                result.append((req_file.read_text(encoding="utf-8").splitlines(), f"addons dir ({Path(p).name})"))
+                result.append((_read_requirement_lines(req_file), f"addons dir ({Path(p).name})"))
     for mf in manifest_files:
-        ext_deps = parsed_manifests[mf].get("external_dependencies", {})
-        if isinstance(ext_deps.get("python"), list):
-            result.append((ext_deps["python"], f"addon manifest ({mf.parent.name})"))
+        if python_deps := manifest_python_deps[mf]:
+            result.append((python_deps, f"addon manifest ({mf.parent.name})"))
     return result
 
 
@@ -363,7 +457,7 @@ def _scan_user_sources(
     install_addons_dirs_requirements: bool,
     addons_paths: list[str] | None,
     manifest_files: list[Path],
-    parsed_manifests: dict[Path, dict],
+    manifest_python_deps: dict[Path, list[str]],
     target_env: dict[str, str],
 ) -> set[str]:
     """Scan all user requirement sources using the given collector function.
@@ -379,28 +473,27 @@ def _scan_user_sources(
     if extra_requirements_file:
         path = Path(extra_requirements_file).expanduser().resolve()
         if path.exists():
-            result |= collector_fn(path.read_text(encoding="utf-8").splitlines(), target_env)
+            result |= collector_fn(_read_requirement_lines(path), target_env)
 
     if install_addons_dirs_requirements and addons_paths:
         for p in addons_paths:
             req_file = Path(p) / "requirements.txt"
             if req_file.exists():
-                result |= collector_fn(req_file.read_text(encoding="utf-8").splitlines(), target_env)
+                result |= collector_fn(_read_requirement_lines(req_file), target_env)
 
     # manifest_files is already empty when install_addons_manifests_requirements is False
     for mf in manifest_files:
-        ext_deps = parsed_manifests[mf].get("external_dependencies", {})
-        if isinstance(ext_deps.get("python"), list):
-            result |= collector_fn(ext_deps["python"], target_env)
+        if python_deps := manifest_python_deps[mf]:
+            result |= collector_fn(python_deps, target_env)
 
     return result
 
 
 def _keep_if_marker_matches(req_line: str, env: dict | None = None) -> str | None:
-    req_line = req_line.split("#")[0].strip()
+    # req_line arrives stripped and with any trailing comment already removed.
     if not req_line:
         return None
-    req = Requirement(req_line)
+    req = _cached_requirement(req_line)
 
     if req.marker and not req.marker.evaluate(environment=env):
         return None
@@ -417,29 +510,37 @@ def _run_command(
     verbose: bool = False,
     extra_env: dict[str, str] | None = None,
     raise_on_error: bool = False,
+    input_text: str | None = None,
 ):
 
     if verbose:
         typer.secho(f"  → Running: {' '.join(command)}", fg=typer.colors.BLUE)
 
-    env = os.environ.copy()
-    if venv_dir:
-        env["PATH"] = str(venv_dir / "bin") + os.pathsep + env["PATH"]
-        env["VIRTUAL_ENV"] = str(venv_dir)
-    if extra_env:
-        env.update(extra_env)
+    # With no overrides the child simply inherits os.environ; only copy it when needed.
+    env = None
+    if venv_dir or extra_env:
+        env = os.environ.copy()
+        if venv_dir:
+            env["PATH"] = str(venv_dir / "bin") + os.pathsep + env["PATH"]
+            env["VIRTUAL_ENV"] = str(venv_dir)
+        if extra_env:
+            env.update(extra_env)
 
     # safe to ignore S603 as shell=False
+    # No caller reads stdout (uv's progress/log output), so it is discarded rather than
+    # buffered in memory; stderr is kept for error reporting.
     result = subprocess.run(  # noqa: S603
         command,
         env=env,
-        capture_output=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
         text=True,
         cwd=cwd,
+        input=input_text,
     )
     if result.returncode != 0:
         if raise_on_error:
-            raise subprocess.CalledProcessError(result.returncode, command, output=result.stdout, stderr=result.stderr)
+            raise subprocess.CalledProcessError(result.returncode, command, stderr=result.stderr)
         typer.echo(result.stderr, file=sys.stderr)
         sys.exit(1)
     return result
@@ -478,25 +579,43 @@ def _extract_failed_package(stderr: str) -> str | None:
     return None
 
 
+def _requirement_line_name(line: str) -> str | None:
+    """Return the normalised package name of a requirements-file line, if any.
+
+    >>> _requirement_line_name("Rfc6266_Parser==0.0.6  # pinned")
+    'rfc6266-parser'
+    >>> _requirement_line_name("# comment") is None
+    True
+    """
+    line_pkg = line.partition("#")[0].strip()
+    try:
+        name = _cached_requirement(line_pkg).name
+    except InvalidRequirement:
+        name = _extract_pkg_name(line_pkg)
+    return re.sub(r"[-_.]", "-", name.lower()) if name else None
+
+
 def _install_requirements_with_retry(
-    tmp_path: str,
+    requirements: str,
     venv_dir: Path,
     verbose: bool,
     max_retries: int = 10,
 ) -> list[str]:
     """Attempt to install requirements, skipping packages that fail to install.
 
-    On each failure, parses uv's stderr to identify the offending package,
-    removes it from the requirements file, and retries. If the failing package
+    *requirements* is the requirements-file text, fed to uv on stdin. On each
+    failure, parses uv's stderr to identify the offending package, removes it
+    from the requirements, and retries. If the failing package
     cannot be determined, exits with an error.
 
     Returns the list of package names that were skipped.
     """
     skipped: list[str] = []
     skipped_normalized: set[str] = set()
+    lines = requirements.splitlines(keepends=True)
 
     for attempt in range(max_retries + 1):
-        install_args = ["uv", "pip", "install", "-r", tmp_path]
+        install_args = ["uv", "pip", "install", "-r", "-"]
         try:
             _run_command(
                 install_args,
@@ -504,6 +623,7 @@ def _install_requirements_with_retry(
                 verbose=False,
                 raise_on_error=True,
                 extra_env={"UV_PRERELEASE": "allow"},
+                input_text="".join(lines),
             )
         except subprocess.CalledProcessError as exc:
             if attempt == max_retries:
@@ -540,22 +660,9 @@ def _install_requirements_with_retry(
                 skipped.append(pkg)
                 skipped_normalized.add(pkg_normalized)
 
-                # Rewrite the requirements file without the failing package.
+                # Drop the failing package from the requirements.
                 # Use normalised name comparison to handle hyphen/underscore variants.
-                with open(tmp_path, encoding="utf-8") as f:
-                    lines = f.readlines()
-                filtered = []
-                for line in lines:
-                    line_pkg = line.strip().split("#")[0].strip()
-                    try:
-                        line_normalized = re.sub(r"[-_.]", "-", Requirement(line_pkg).name.lower())
-                    except InvalidRequirement:
-                        match = PKG_NAME_PATTERN.match(line_pkg)
-                        line_normalized = re.sub(r"[-_.]", "-", match.group("lib_name").lower()) if match else None
-                    if line_normalized != pkg_normalized:
-                        filtered.append(line)
-                with open(tmp_path, "w", encoding="utf-8") as f:
-                    f.writelines(filtered)
+                lines = [line for line in lines if _requirement_line_name(line) != pkg_normalized]
             else:
                 typer.echo(exc.stderr, file=sys.stderr)
                 typer.secho(
@@ -617,11 +724,11 @@ def _collect_no_build_isolation_specs(
     """
     result: dict[str, str] = {}
     for line in req_lines:
-        line = line.split("#")[0].strip()
+        line = line.partition("#")[0].strip()
         if not line:
             continue
         try:
-            req = Requirement(line)
+            req = _cached_requirement(line)
             pkg_normalized = re.sub(r"[-_.]", "-", req.name.lower())
             if pkg_normalized not in _NO_BUILD_ISOLATION_PACKAGES:
                 continue
@@ -637,65 +744,233 @@ def _collect_no_build_isolation_specs(
 
 def _get_python_version_from_odoo_src(odoo_dir: Path) -> str | None:
     init_py = odoo_dir / "odoo" / "__init__.py"
-    if not init_py.is_file():
+    # MIN_PY_VERSION sits right below the license header; a bounded head read keeps
+    # the cost constant however large a patched fork's __init__.py grows.
+    try:
+        with open(init_py, "rb") as f:
+            head = f.read(4096)
+    except OSError:
         return None
 
-    content = init_py.read_text()
-    match = re.search(r"MIN_PY_VERSION\s*=\s*\((\d+),\s*(\d+)\)", content)
+    match = _MIN_PY_VERSION_RE.search(head)
     if match:
-        return f"{match.group(1)}.{match.group(2)}"
+        return f"{int(match.group(1))}.{int(match.group(2))}"
     return None
 
 
-def _find_manifest_files(addons_paths: list[str]) -> list[Path]:
+@lru_cache(maxsize=256)
+def _read_lines_cached(path: str, mtime_ns: int) -> list[str]:
+    lines = (line.strip() for line in Path(path).read_text(encoding="utf-8").splitlines())
+    return [line for line in lines if line and line[0] != "#"]
+
+
+def _read_requirement_lines(path: Path) -> list[str]:
+    """Return the stripped lines of a requirements file, read from disk once per (path, mtime).
+
+    Odoo's and the addons dirs' requirements.txt and the extra requirements file are
+    scanned by several passes (pre-scans, NBI detection, the main loop); they now share
+    one read.  Blank and comment-only lines are dropped here rather than in each pass.
+    The returned list is shared between calls and must not be mutated.
+
+    >>> import tempfile
+    >>> with tempfile.TemporaryDirectory() as d:
+    ...     req_file = Path(d) / "requirements.txt"
+    ...     _ = req_file.write_text("# pinned by Odoo\\n\\n  lxml==4.9.3  # C ext\\nBabel\\n")
+    ...     _read_requirement_lines(req_file)
+    ['lxml==4.9.3  # C ext', 'Babel']
+    """
+    return _read_lines_cached(str(path), path.stat().st_mtime_ns)
+
+
+@lru_cache(maxsize=4096)
+def _parse_manifest_external_dependencies(manifest_path: str, mtime_ns: int) -> dict:
+    """Return the ``external_dependencies`` dict of a manifest (``{}`` when absent).
+
+    Only the value node of that key is literal-evaluated; the rest of the manifest
+    (descriptions, data file lists, assets...) is parsed to AST but never turned into
+    Python objects.  *mtime_ns* is part of the cache key so an edited manifest is re-read.
+    The returned dict is shared between calls and must not be mutated.
+    """
+    # Strip leading blanks as ast.literal_eval() does, so an indented manifest still parses.
+    tree = ast.parse(Path(manifest_path).read_text(encoding="utf-8").lstrip(" \t"), mode="eval")
+    if not isinstance(tree.body, ast.Dict):
+        ext_deps = ast.literal_eval(tree).get("external_dependencies", {})
+    else:
+        # Keep the last matching key, as a dict literal with a repeated key would.
+        ext_deps_node = None
+        for key, value in zip(tree.body.keys, tree.body.values, strict=True):
+            if isinstance(key, ast.Constant) and key.value == "external_dependencies":
+                ext_deps_node = value
+        ext_deps = ast.literal_eval(ext_deps_node) if ext_deps_node is not None else {}
+    return ext_deps if isinstance(ext_deps, dict) else {}
+
+
+def _read_manifest_external_dependencies(manifest_path: Path) -> dict:
+    """Cached :func:`_parse_manifest_external_dependencies` keyed on the file's mtime.
+
+    >>> import tempfile
+    >>> with tempfile.TemporaryDirectory() as d:
+    ...     mf = Path(d) / "__manifest__.py"
+    ...     _ = mf.write_text("{'name': 'x', 'external_dependencies': {'python': ['lxml']}}")
+    ...     _read_manifest_external_dependencies(mf)
+    {'python': ['lxml']}
+    """
+    return _parse_manifest_external_dependencies(str(manifest_path), manifest_path.stat().st_mtime_ns)
+
+
+def _extract_python_deps(manifest_path: Path) -> list[str]:
+    """Return a manifest's ``external_dependencies["python"]`` list (``[]`` when absent)."""
+    python_deps = _read_manifest_external_dependencies(manifest_path).get("python")
+    return python_deps if isinstance(python_deps, list) else []
+
+
+# Directories that never hold Odoo addons but can be huge (VCS data, JS deps, bytecode).
+_SKIP_WALK_DIRS = frozenset({"__pycache__", "node_modules"})
+
+
+def _find_manifests_in_path(path: str) -> list[Path]:
+    """Return the ``__manifest__.py`` files under *path*, in ``os.walk`` (top-down) order.
+
+    Hidden directories, ``__pycache__`` and ``node_modules`` are pruned, and an addon's own
+    subtree (``static/``, ``views/``...) is not descended into once its manifest is found.
+    As with ``os.walk``, symlinked directories are not followed.
+    """
     manifest_files = []
-    for path in addons_paths:
-        for root, _, files in os.walk(path):
-            if "__manifest__.py" in files:
-                manifest_files.append(Path(root) / "__manifest__.py")
+    stack = [path]
+    while stack:
+        root = stack.pop()
+        subdirs = []
+        has_manifest = False
+        try:
+            with os.scandir(root) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name[0] != "." and entry.name not in _SKIP_WALK_DIRS:
+                            subdirs.append(entry.path)
+                    elif entry.name == "__manifest__.py":
+                        has_manifest = True
+        except OSError:
+            continue
+        if has_manifest:
+            manifest_files.append(Path(root) / "__manifest__.py")
+            continue
+        stack.extend(reversed(subdirs))
     return manifest_files
 
 
+def _find_manifest_files(addons_paths: list[str]) -> list[Path]:
+    # Each addons path is walked in its own thread (the walk is syscall-bound); map()
+    # keeps the results in addons-path order.
+    if len(addons_paths) <= 1:
+        return [mf for path in addons_paths for mf in _find_manifests_in_path(path)]
+    with ThreadPoolExecutor(max_workers=min(_IO_WORKERS, len(addons_paths))) as executor:
+        return [mf for found in executor.map(_find_manifests_in_path, addons_paths) for mf in found]
+
+
+@lru_cache(maxsize=1024)
+def _is_ignored_specifier(spec: str, ignored_spec: str) -> bool:
+    """Whether a requirement with specifier *spec* is covered by an ignore entry with *ignored_spec*.
+
+    An ignore entry without specifier covers every requirement of that package; otherwise the
+    requirement must carry all of the entry's specifiers (``spec & ignored == spec``).
+    Memoized on the specifier strings, which repeat across requirement lines.
+
+    >>> _is_ignored_specifier("==1.0", "")
+    True
+    >>> _is_ignored_specifier("", ">=1.0")
+    False
+    >>> _is_ignored_specifier("<2,>=1.0", ">=1.0")
+    True
+    >>> _is_ignored_specifier(">=0.5", ">=1.0")
+    False
+    """
+    if not ignored_spec:
+        return True
+    if not spec:
+        return False
+    if spec == ignored_spec:
+        return True
+    req_spec = SpecifierSet(spec)
+    return (req_spec & SpecifierSet(ignored_spec)) == req_spec
+
+
+def _collect_ignore_specs(*values: str | None) -> list[str]:
+    """Return the entries of the comma-separated ignore options, stripped and de-duplicated in order.
+
+    >>> _collect_ignore_specs("lxml, babel", None, "lxml,, psycopg2>=2.8")
+    ['lxml', 'babel', 'psycopg2>=2.8']
+    """
+    specs: dict[str, None] = {}
+    for value in values:
+        if value:
+            for spec in value.split(","):
+                spec = spec.strip()
+                if spec:
+                    specs[spec] = None
+    return list(specs)
+
+
+def _extract_pkg_name(line: str) -> str | None:
+    """Return the leading run of package-name characters (ASCII letters, digits, ``-_.``) of *line*.
+
+    Done with ``str.lstrip`` instead of a regex match; ``None`` when *line* doesn't start with a name.
+
+    >>> _extract_pkg_name("python-stdnum>=1.9")
+    'python-stdnum'
+    >>> _extract_pkg_name("git+https://github.com/org/repo.git#egg=repo")
+    'git'
+    >>> _extract_pkg_name("/opt/wheels/pkg.whl") is None
+    True
+    """
+    return line[: len(line) - len(line.lstrip(_PKG_NAME_CHARS))] or None
+
+
 def _process_requirement_line(
     req_line: str,
     ignored_req_map: dict,
-    tmp_file,
+    req_lines: dict[str, str],
     target_env_for_markers: dict[str, str],
 ) -> tuple[bool, str | None]:
+    """Filter one requirement line and add it to *req_lines* unless ignored.
+
+    *req_lines* maps a canonical key (normalized name + specifier, or the raw line when it
+    doesn't parse) to the line to install, so a requirement repeated across Odoo, addons
+    dirs and manifests is only handed to uv once.  Duplicates still report ``True`` so the
+    caller records every origin.
+    """
     req_line = req_line.strip()
-    if not req_line or req_line.startswith("#"):
+    if not req_line or req_line[0] == "#":
         return False, None
 
     try:
-        valid_line = _keep_if_marker_matches(req_line, env=target_env_for_markers)
+        valid_line = _keep_if_marker_matches(req_line.partition("#")[0].rstrip(), env=target_env_for_markers)
         if not valid_line:
             return False, None
 
-        req = Requirement(valid_line)
+        req = _cached_requirement(valid_line)
 
         should_ignore = False
-        req_name_normalized = re.sub(r"[-_.]+", "-", req.name.lower())
+        req_name_normalized = _normalize_pkg_name(req.name)
         if req_name_normalized in ignored_req_map:
-            for ignored_req in ignored_req_map[req_name_normalized]:
-                if not ignored_req.specifier or (
-                    req.specifier and (req.specifier & ignored_req.specifier) == req.specifier
-                ):
-                    should_ignore = True
-                    break
+            spec = str(req.specifier)
+            should_ignore = any(
+                _is_ignored_specifier(spec, str(ignored_req.specifier))
+                for ignored_req in ignored_req_map[req_name_normalized]
+            )
 
         if should_ignore:
             return False, None
         else:
-            tmp_file.write(valid_line + "\n")
+            req_lines.setdefault(f"{req_name_normalized}{req.specifier}", valid_line)
             return True, req_name_normalized
 
     except InvalidRequirement:
-        match = PKG_NAME_PATTERN.match(req_line)
-        if match and match.group("lib_name").lower().strip() in ignored_req_map:
+        lib_name = _extract_pkg_name(req_line)
+        if lib_name and lib_name.lower() in ignored_req_map:
             return False, None
         else:
-            tmp_file.write(req_line + "\n")
-            pkg_name = re.sub(r"[-_.]+", "-", match.group("lib_name").lower()) if match else None
+            req_lines.setdefault(req_line, req_line)
+            pkg_name = _normalize_pkg_name(lib_name) if lib_name else None
             return True, pkg_name
 
 
@@ -703,13 +978,7 @@ def _freeze_venv(venv_dir: Path) -> dict[str, str]:
     """Run ``uv pip freeze`` on a venv and return ``{normalized_name: version}``."""
     cmd = ["uv", "pip", "freeze", "--python", str(venv_dir)]
     result = subprocess.run(cmd, capture_output=True, text=True, check=True)  # noqa: S603
-    pkgs: dict[str, str] = {}
-    for line in result.stdout.splitlines():
-        line = line.strip()
-        if "==" in line:
-            name, ver = line.split("==", 1)
-            pkgs[re.sub(r"[-_.]+", "-", name).lower()] = ver
-    return pkgs
+    return parse_requirements_text(result.stdout)
 
 
 def _build_reverse_dep_map(venv_dir: Path, explicit_pkgs: set[str]) -> dict[str, list[str]]:
@@ -779,28 +1048,22 @@ def create_odoo_venv(  # noqa: C901
     # https://github.com/astral-sh/uv/issues/9833
     if python_version:
         py_major_minor = ".".join(python_version.split(".")[:2])
-        if parse_version(py_major_minor) < parse_version("3.7"):
+        if _parse_ver(py_major_minor) < _parse_ver("3.7"):
             typer.secho(
                 f"error: Invalid version request: Python <3.7 is not supported but {python_version} was requested.",
                 fg=typer.colors.RED,
             )
             sys.exit(1)
 
-    current_default_env = default_environment()
-    target_env_for_markers: dict[str, str] = {k: str(v) for k, v in current_default_env.items()}
-    if python_version:
-        target_env_for_markers["python_version"] = ".".join(python_version.split(".")[:2])
-        target_env_for_markers["python_full_version"] = python_version
-    else:
-        target_env_for_markers["python_version"] = current_default_env["python_version"]
-        target_env_for_markers["python_full_version"] = current_default_env["python_full_version"]
+    target_env_for_markers = _marker_environment(python_version)
 
     # 2. Create virtual environment
     typer.secho("Creating virtual environment...")
     if python_version:
         found = subprocess.run(  # noqa: S603
             ["uv", "python", "find", python_version],  # noqa: S607
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
         )
         if found.returncode != 0:
             _run_command(
@@ -845,6 +1108,14 @@ def create_odoo_venv(  # noqa: C901
     )
 
     # 3. Process requirements
+    if addons_paths:
+        # A directory listed twice (relative and absolute, through a symlink...) would have its
+        # requirements.txt and manifests scanned twice; keep the first spelling of each.
+        unique_addons_paths: dict[str, str] = {}
+        for path in addons_paths:
+            unique_addons_paths.setdefault(os.path.realpath(path), path)
+        addons_paths = list(unique_addons_paths.values())
+
     all_req_files = []
     if install_odoo_requirements:
         odoo_reqs_file = odoo_dir / "requirements.txt"
@@ -854,27 +1125,25 @@ def create_odoo_venv(  # noqa: C901
     if install_addons_dirs_requirements and addons_paths:
         for path in addons_paths:
             addons_req_file = Path(path) / "requirements.txt"
-            if addons_req_file.exists():
+            if addons_req_file.exists() and addons_req_file not in all_req_files:
                 all_req_files.append(addons_req_file)
 
-    ignore_req_lines = []
-    if ignore_from_odoo_requirements:
-        ignore_req_lines.extend([pkg.strip() for pkg in ignore_from_odoo_requirements.split(",") if pkg.strip()])
-    if ignore_from_addons_dirs_requirements:
-        ignore_req_lines.extend([pkg.strip() for pkg in ignore_from_addons_dirs_requirements.split(",") if pkg.strip()])
-    if ignore_from_addons_manifests_requirements:
-        ignore_req_lines.extend([
-            pkg.strip() for pkg in ignore_from_addons_manifests_requirements.split(",") if pkg.strip()
-        ])
+    ignore_req_lines = _collect_ignore_specs(
+        ignore_from_odoo_requirements,
+        ignore_from_addons_dirs_requirements,
+        ignore_from_addons_manifests_requirements,
+    )
 
     ignored_req_map = defaultdict(list)
     for req_line in ignore_req_lines:
         try:
-            req = Requirement(req_line)
+            req = _cached_requirement(req_line)
             if not req.marker or req.marker.evaluate(target_env_for_markers):
-                new_req_str = f"{req.name}{req.specifier}"
-                new_req = Requirement(new_req_str)
-                ignored_req_map[new_req.name.lower()].append(new_req)
+                # Only name + specifier matter for matching; re-parse the stripped form
+                # only when the entry actually carries a marker, extras or URL.
+                if req.marker or req.extras or req.url:
+                    req = _cached_requirement(f"{req.name}{req.specifier}")
+                ignored_req_map[req.name.lower()].append(req)
         except InvalidRequirement:
             typer.secho(
                 f"  ⚠ Invalid requirement in ignore list: {req_line}",
@@ -889,8 +1158,13 @@ def create_odoo_venv(  # noqa: C901
     if install_addons_manifests_requirements and addons_paths:
         manifest_files = _find_manifest_files(addons_paths)
 
-    # Cache parsed manifests to avoid re-reading/parsing the same files multiple times.
-    parsed_manifests: dict[Path, dict] = {mf: ast.literal_eval(mf.read_text(encoding="utf-8")) for mf in manifest_files}
+    # Read each manifest's python dependencies once; reused by the pre-scans and the main loop.
+    manifest_python_deps: dict[Path, list[str]] = {}
+    if manifest_files:
+        with ThreadPoolExecutor(max_workers=min(_IO_WORKERS, len(manifest_files))) as executor:
+            manifest_python_deps = dict(
+                zip(manifest_files, executor.map(_extract_python_deps, manifest_files), strict=True)
+            )
 
     # Collect the set of packages actually present in the base requirement files
     # (Odoo's requirements.txt and addons dirs).  Auto-ignore logic is restricted to
@@ -899,16 +1173,16 @@ def create_odoo_venv(  # noqa: C901
     base_pinned: set[str] = set()
     base_specifiers: dict[str, str] = {}  # {normalized_name: "name==version"}
     for req_file in all_req_files:
-        lines = req_file.read_text(encoding="utf-8").splitlines()
+        lines = _read_requirement_lines(req_file)
         base_pinned |= _collect_mentioned_packages(lines, target_env_for_markers)
         for line in lines:
-            line = line.split("#")[0].strip()
+            line = line.partition("#")[0].strip()
             if not line:
                 continue
             try:
-                req = Requirement(line)
+                req = _cached_requirement(line)
                 if req.specifier and (not req.marker or req.marker.evaluate(environment=target_env_for_markers)):
-                    name = re.sub(r"[-_.]+", "-", req.name.lower())
+                    name = _normalize_pkg_name(req.name)
                     base_specifiers[name] = f"{req.name}{req.specifier}"
             except InvalidRequirement:
                 pass
@@ -919,7 +1193,7 @@ def create_odoo_venv(  # noqa: C901
         install_addons_dirs_requirements,
         addons_paths,
         manifest_files,
-        parsed_manifests,
+        manifest_python_deps,
         target_env_for_markers,
     )
 
@@ -934,12 +1208,12 @@ def create_odoo_venv(  # noqa: C901
         install_addons_dirs_requirements,
         addons_paths,
         manifest_files,
-        parsed_manifests,
+        manifest_python_deps,
     )
     user_constrained_sources = _identify_constrained_sources(labeled_sources, target_env_for_markers)
     for pkg_name in user_constrained & base_pinned:
         if not any(not r.specifier for r in ignored_req_map[pkg_name]):
-            ignored_req_map[pkg_name].append(Requirement(pkg_name))
+            ignored_req_map[pkg_name].append(_cached_requirement(pkg_name))
             # Skip auto_override tracking when already explicitly ignored (e.g. by preset)
             if pkg_name not in explicit_ignore_names:
                 source = user_constrained_sources.get(pkg_name, "user requirement")
@@ -960,7 +1234,7 @@ def create_odoo_venv(  # noqa: C901
             if transitive not in base_pinned:
                 continue
             if not any(not r.specifier for r in ignored_req_map[transitive]):
-                ignored_req_map[transitive].append(Requirement(transitive))
+                ignored_req_map[transitive].append(_cached_requirement(transitive))
                 # Skip transitive_conflict tracking when already explicitly ignored
                 if transitive not in explicit_ignore_names:
                     ignored_tracking[transitive].append(f"transitive_conflict:{pkg_name}")
@@ -976,7 +1250,7 @@ def create_odoo_venv(  # noqa: C901
     no_build_isolation_specs: dict[str, str] = {}
     for req_file in all_req_files:
         no_build_isolation_specs.update(
-            _collect_no_build_isolation_specs(req_file.read_text(encoding="utf-8").splitlines(), *_nbi_args)
+            _collect_no_build_isolation_specs(_read_requirement_lines(req_file), *_nbi_args)
         )
     if extra_requirements:
         no_build_isolation_specs.update(_collect_no_build_isolation_specs(extra_requirements, *_nbi_args))
@@ -984,14 +1258,13 @@ def create_odoo_venv(  # noqa: C901
         _extra_req_path = Path(extra_requirements_file).expanduser().resolve()
         if _extra_req_path.exists():
             no_build_isolation_specs.update(
-                _collect_no_build_isolation_specs(_extra_req_path.read_text(encoding="utf-8").splitlines(), *_nbi_args)
+                _collect_no_build_isolation_specs(_read_requirement_lines(_extra_req_path), *_nbi_args)
             )
     for mf in manifest_files:
-        ext_deps = parsed_manifests[mf].get("external_dependencies", {})
-        if isinstance(ext_deps.get("python"), list):
-            no_build_isolation_specs.update(_collect_no_build_isolation_specs(ext_deps["python"], *_nbi_args))
+        if python_deps := manifest_python_deps[mf]:
+            no_build_isolation_specs.update(_collect_no_build_isolation_specs(python_deps, *_nbi_args))
     for pkg_name in no_build_isolation_specs:
-        ignored_req_map[pkg_name].append(Requirement(pkg_name))
+        ignored_req_map[pkg_name].append(_cached_requirement(pkg_name))
         origins[pkg_name].append("no_build_isolation")
         if verbose:
             typer.secho(
@@ -1005,61 +1278,57 @@ def create_odoo_venv(  # noqa: C901
         source_tag = _ignore_sources.get(pkg_name, "explicit_ignore")
         ignored_tracking[pkg_name].append(source_tag)
 
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt", encoding="utf-8") as tmp:
-        tmp_path = tmp.name
-        req_count = 0
-
-        if all_req_files:
-            for req_file in all_req_files:
-                origin = "odoo" if req_file == odoo_reqs_path else f"addons_dir:{req_file.parent}"
-                with open(req_file, encoding="utf-8") as f:
-                    for line in f:
-                        written, pkg_name = _process_requirement_line(
-                            line, ignored_req_map, tmp, target_env_for_markers
-                        )
-                        if written and pkg_name:
-                            req_count += 1
-                            if origin not in origins[pkg_name]:
-                                origins[pkg_name].append(origin)
-
-        if extra_requirements:
-            for req_line in extra_requirements:
-                written, pkg_name = _process_requirement_line(req_line, {}, tmp, target_env_for_markers)
+    # Collected in memory (deduplicated) and written to the temp requirements file in one go below.
+    req_lines: dict[str, str] = {}
+    req_count = 0
+
+    if all_req_files:
+        for req_file in all_req_files:
+            origin = "odoo" if req_file == odoo_reqs_path else f"addons_dir:{req_file.parent}"
+            for line in _read_requirement_lines(req_file):
+                written, pkg_name = _process_requirement_line(line, ignored_req_map, req_lines, target_env_for_markers)
                 if written and pkg_name:
                     req_count += 1
-                    if "extra_requirement" not in origins[pkg_name]:
-                        origins[pkg_name].append("extra_requirement")
-
-        if extra_requirements_file:
-            extra_req_file = Path(extra_requirements_file).expanduser().resolve()
-            if extra_req_file.exists():
-                origin = f"extra_requirements_file:{extra_req_file}"
-                with open(extra_req_file, encoding="utf-8") as f:
-                    for line in f:
-                        written, pkg_name = _process_requirement_line(line, {}, tmp, target_env_for_markers)
-                        if written and pkg_name:
-                            req_count += 1
-                            if origin not in origins[pkg_name]:
-                                origins[pkg_name].append(origin)
-
-        if manifest_files:
-            for manifest_file in manifest_files:
-                module_name = manifest_file.parent.name
-                manifest = parsed_manifests[manifest_file]
-                ext_deps = manifest.get("external_dependencies", {})
-                if isinstance(ext_deps.get("python"), list):
-                    for dep in ext_deps["python"]:
-                        written, pkg_name = _process_requirement_line(
-                            _resolve_manifest_dep(dep),
-                            ignored_req_map,
-                            tmp,
-                            target_env_for_markers,
-                        )
-                        if written and pkg_name:
-                            req_count += 1
-                            origin = f"manifest:{module_name}"
-                            if origin not in origins[pkg_name]:
-                                origins[pkg_name].append(origin)
+                    if origin not in origins[pkg_name]:
+                        origins[pkg_name].append(origin)
+
+    if extra_requirements:
+        for req_line in extra_requirements:
+            written, pkg_name = _process_requirement_line(req_line, {}, req_lines, target_env_for_markers)
+            if written and pkg_name:
+                req_count += 1
+                if "extra_requirement" not in origins[pkg_name]:
+                    origins[pkg_name].append("extra_requirement")
+
+    if extra_requirements_file:
+        extra_req_file = Path(extra_requirements_file).expanduser().resolve()
+        if extra_req_file.exists():
+            origin = f"extra_requirements_file:{extra_req_file}"
+            for line in _read_requirement_lines(extra_req_file):
+                written, pkg_name = _process_requirement_line(line, {}, req_lines, target_env_for_markers)
+                if written and pkg_name:
+                    req_count += 1
+                    if origin not in origins[pkg_name]:
+                        origins[pkg_name].append(origin)
+
+    if manifest_files:
+        for manifest_file in manifest_files:
+            module_name = manifest_file.parent.name
+            for dep in manifest_python_deps[manifest_file]:
+                written, pkg_name = _process_requirement_line(
+                    _resolve_manifest_dep(dep),
+                    ignored_req_map,
+                    req_lines,
+                    target_env_for_markers,
+                )
+                if written and pkg_name:
+                    req_count += 1
+                    origin = f"manifest:{module_name}"
+                    if origin not in origins[pkg_name]:
+                        origins[pkg_name].append(origin)
+
+    # Passed to uv on stdin (``-r -``) rather than through a temporary file.
+    requirements_text = "".join(f"{line}\n" for line in req_lines.values())
 
     skipped: list[str] = []
     if req_count > 0:
@@ -1073,14 +1342,12 @@ def create_odoo_venv(  # noqa: C901
                 for pkg_name in sorted(ignored_req_map.keys()):
                     for req in ignored_req_map[pkg_name]:
                         typer.secho(f"      - {req}", fg=typer.colors.YELLOW)
-            with open(tmp_path, encoding="utf-8") as f:
-                requirements = f.read().splitlines()
-                typer.secho("   Packages to install:", fg=typer.colors.BLUE)
-                for req in requirements:
-                    typer.secho(f"      - {req}", fg=typer.colors.CYAN)
+            typer.secho("   Packages to install:", fg=typer.colors.BLUE)
+            for req in req_lines.values():
+                typer.secho(f"      - {req}", fg=typer.colors.CYAN)
 
         if skip_on_failure:
-            skipped = _install_requirements_with_retry(tmp_path, venv_dir=venv_dir_path, verbose=verbose)
+            skipped = _install_requirements_with_retry(requirements_text, venv_dir=venv_dir_path, verbose=verbose)
             if skipped:
                 typer.secho(
                     f"  ⚠  Skipped {len(skipped)} package(s) due to installation failure: "
@@ -1093,15 +1360,14 @@ def create_odoo_venv(  # noqa: C901
                     origins.pop(pkg_normalized, None)
         else:
             _run_command(
-                ["uv", "pip", "install", "-r", tmp_path],
+                ["uv", "pip", "install", "-r", "-"],
                 venv_dir=venv_dir_path,
                 verbose=False,
                 extra_env={"UV_PRERELEASE": "allow"},
+                input_text=requirements_text,
             )
         typer.secho(f"  ✔  {typer.style(req_count, fg=typer.colors.YELLOW)} Packages installed successfully")
 
-    os.remove(tmp_path)
-
     # Odoo <= 13.0 requires setuptools<58 (2to3 support removed in 58.0) and wheel
     # as build tools for packages like vatnumber that use the legacy setup.py build system.
     if _evaluate_marker("odoo_version <= '13.0'", odoo_version, python_version):
@@ -1,6 +1,5 @@
 """Orchestrator and DB lifecycle for the ovx command."""
 
-import ast
 import contextlib
 import re
 import shutil
@@ -15,7 +14,7 @@ import typer
 
 from odoo_venv.exceptions import OdooVenvError
 from odoo_venv.launcher import create_launcher
-from odoo_venv.main import create_odoo_venv
+from odoo_venv.main import _extract_python_deps, create_odoo_venv
 from odoo_venv.ovx_resolver import (
     ResolvedVenv,
     clone_venv,
@@ -185,8 +184,7 @@ def run_ovx(
             all_python_deps: list[str] = []
             seen: set[str] = set()
             for p in addon_paths:
-                manifest = ast.literal_eval((p / "__manifest__.py").read_text())
-                for dep in manifest.get("external_dependencies", {}).get("python", []):
+                for dep in _extract_python_deps(p / "__manifest__.py"):
                     if dep not in seen:
                         seen.add(dep)
                         all_python_deps.append(dep)
@@ -1,9 +1,8 @@
 import re
 from dataclasses import dataclass, fields
+from functools import lru_cache
 from pathlib import Path
 
-import tomli
-
 VENV_CONFIG_FILENAME = ".odoo-venv.toml"
 
 # Canonical list of args persisted in .odoo-venv.toml [args] section.
@@ -44,8 +43,44 @@ def split_escaped(s: str, sep: str = ",") -> list[str]:
     >>> split_escaped("")
     ['']
     """
-    parts = re.split(rf"(?<!\\){re.escape(sep)}", s)
-    return [p.replace(f"\\{sep}", sep) for p in parts]
+    if f"\\{sep}" not in s:
+        return s.split(sep)
+    # Re-join the chunks whose separator was escaped, dropping the backslash.
+    chunks = s.split(sep)
+    parts: list[str] = []
+    pending = ""
+    for chunk in chunks[:-1]:
+        if chunk.endswith("\\"):
+            pending += chunk[:-1] + sep
+        else:
+            parts.append(pending + chunk)
+            pending = ""
+    parts.append(pending + chunks[-1])
+    return parts
+
+
+def parse_requirements_text(text: str) -> dict[str, str]:
+    """Parse pip-freeze-style text into a ``{normalized_name: version}`` dict.
+
+    >>> parse_requirements_text("Foo_Bar==1.0\\n# comment\\nbaz @ file:///tmp/baz\\n")
+    {'foo-bar': '1.0'}
+    """
+    pkgs: dict[str, str] = {}
+    for line in text.splitlines():
+        line = line.strip()
+        if line and not line.startswith("#") and "==" in line:
+            name, ver = line.split("==", 1)
+            pkgs[re.sub(r"[-_.]+", "-", name).lower()] = ver
+    return pkgs
+
+
+def _load_toml(text: str) -> dict:
+    # Imported on first use: `odoo-venv --help` and most commands never read TOML.
+    try:
+        import tomllib
+    except ImportError:  # Python < 3.11
+        import tomli as tomllib
+    return tomllib.loads(text)
 
 
 MODULE_PATH = Path(__file__).parent
@@ -68,11 +103,25 @@ class Preset:
 
     @classmethod
     def from_dict(cls, data: dict) -> "Preset":
-        valid_fields = {f.name for f in fields(cls)}
-        data = {k: v for k, v in data.items() if k in valid_fields}
+        data = {k: v for k, v in data.items() if k in _PRESET_FIELD_SET}
         return cls(**data)
 
 
+# Preset's field names, enumerated once rather than on every from_dict() call.
+PRESET_FIELD_NAMES: tuple[str, ...] = tuple(f.name for f in fields(Preset))
+_PRESET_FIELD_SET = frozenset(PRESET_FIELD_NAMES)
+
+
+# Preset fields whose [common] value is extended, rather than replaced, by a specific preset.
+_PRESET_STRING_LIST_FIELDS = frozenset({
+    "ignore_from_odoo_requirements",
+    "ignore_from_addons_dirs_requirements",
+    "ignore_from_addons_manifests_requirements",
+    "extra_requirement",
+})
+_PRESET_LIST_FIELDS = frozenset({"extra_commands"})
+
+
 def _merge_preset_options(
     common_options: dict,
     preset_options: dict,
@@ -86,34 +135,26 @@ def _merge_preset_options(
     Returns:
         Merged options dictionary
     """
-    string_list_fields = {
-        "ignore_from_odoo_requirements",
-        "ignore_from_addons_dirs_requirements",
-        "ignore_from_addons_manifests_requirements",
-        "extra_requirement",
+    merged_options = {
+        key: common_value
+        for key, common_value in common_options.items()
+        if key != "description" and common_value is not None
     }
-    list_fields = {"extra_commands"}
-
-    merged_options = {}
 
-    # Apply settings from 'common' preset
-    for key, common_value in common_options.items():
-        if key != "description" and common_value is not None:
-            merged_options[key] = common_value
-
-    # Apply from specific preset
+    # Apply from specific preset, extending the fields that accumulate
     for key, val in preset_options.items():
         if val is None:
             continue
 
-        if key in list_fields and key in merged_options and merged_options[key]:
+        common_value = merged_options.get(key)
+        if common_value and key in _PRESET_LIST_FIELDS:
             # Extend list fields
-            if isinstance(merged_options[key], list) and isinstance(val, list):
-                merged_options[key] = merged_options[key] + val
+            if isinstance(common_value, list) and isinstance(val, list):
+                merged_options[key] = common_value + val
             else:
                 merged_options[key] = val
-        elif key in string_list_fields and key in merged_options and merged_options[key]:
-            merged_options[key] = f"{merged_options[key]},{val}"
+        elif common_value and key in _PRESET_STRING_LIST_FIELDS:
+            merged_options[key] = f"{common_value},{val}"
         else:
             merged_options[key] = val
 
@@ -121,8 +162,19 @@ def _merge_preset_options(
 
 
 def load_presets() -> dict[str, Preset]:
-    with open(DEFAULT_PRESETS_PATH, "rb") as f:
-        presets_data = tomli.load(f)
+    """Load the bundled presets, with ``[common]`` merged into every other preset.
+
+    The parsed result is cached per presets-file mtime (callbacks for ``--preset``,
+    ``--project-dir`` and ``--from`` may each ask for it), so repeated calls only cost a
+    ``stat``; editing the file invalidates the cache. Callers must treat the result as
+    read-only.
+    """
+    return _cached_load(DEFAULT_PRESETS_PATH.stat().st_mtime_ns)
+
+
+@lru_cache(maxsize=1)
+def _cached_load(mtime_ns: int) -> dict[str, Preset]:
+    presets_data = _load_toml(DEFAULT_PRESETS_PATH.read_text(encoding="utf-8"))
 
     if "common" in presets_data:
         common_options = presets_data["common"]
@@ -223,6 +275,5 @@ def read_venv_config(
         path = path / VENV_CONFIG_FILENAME
     if not path.exists():
         raise FileNotFoundError(path)
-    with open(path, "rb") as f:
-        data = tomli.load(f)
+    data = _load_toml(path.read_text(encoding="utf-8"))
     return data.get("args", {}), data.get("metadata", {}), data.get("requirements", {}), data.get("ignored", {})
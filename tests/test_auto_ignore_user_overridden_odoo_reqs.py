@@ -5,6 +5,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from odoo_venv.main import (
+    _find_manifest_files,
     create_odoo_venv,
 )
 
@@ -17,25 +18,30 @@ def _make_odoo_dir(tmp_path: Path, reqs: str) -> Path:
     return odoo_dir
 
 
+def _make_addon(addons_dir: Path, name: str, python_deps: list[str]) -> Path:
+    """Create a minimal addon whose manifest declares *python_deps* as external dependencies."""
+    addon = addons_dir / name
+    addon.mkdir(parents=True)
+    manifest = {"name": name, "external_dependencies": {"python": python_deps}}
+    (addon / "__manifest__.py").write_text(repr(manifest), encoding="utf-8")
+    return addon
+
+
 def _run_dry(tmp_path: Path, odoo_dir: Path, **kwargs) -> str:
-    """Run create_odoo_venv with mocked subprocess calls and return the temp requirements file contents.
+    """Run create_odoo_venv with mocked subprocess calls and return the generated requirements text.
 
-    Patches os.remove to capture the temp file path before deletion.
+    Patches _run_command to capture the requirements piped to ``uv pip install -r -``.
     Patches subprocess.run and _run_command to prevent real uv/pip calls
     (tests only check requirement filtering logic).
     Accepts any create_odoo_venv kwarg to override defaults.
     """
-    captured = []
-    original_remove = __import__("os").remove
-
     mock_result = MagicMock(spec=subprocess.CompletedProcess)
     mock_result.returncode = 0
     mock_result.stdout = ""
 
     with (
-        patch("odoo_venv.main.os.remove", side_effect=lambda p: captured.append(p)),
         patch("odoo_venv.main.subprocess.run", return_value=mock_result),
-        patch("odoo_venv.main._run_command"),
+        patch("odoo_venv.main._run_command") as mock_run_command,
     ):
         create_odoo_venv(
             odoo_version=kwargs.pop("odoo_version", "17.0"),
@@ -47,11 +53,11 @@ def _run_dry(tmp_path: Path, odoo_dir: Path, **kwargs) -> str:
             **kwargs,
         )
 
-    assert captured, "os.remove was never called — temp file was not created"
-    tmp_file = Path(captured[0])
-    contents = tmp_file.read_text(encoding="utf-8")
-    original_remove(str(tmp_file))
-    return contents
+    # No install call is made when every requirement was filtered out.
+    for call in mock_run_command.call_args_list:
+        if call.args[0] == ["uv", "pip", "install", "-r", "-"]:
+            return call.kwargs["input_text"]
+    return ""
 
 
 class TestDirectOverride:
@@ -111,3 +117,33 @@ class TestTransitiveConflict:
         odoo_dir = _make_odoo_dir(tmp_path, "pyparsing==2.1.0\n")
         contents = _run_dry(tmp_path, odoo_dir, extra_requirements=["some-random-package"])
         assert "pyparsing==2.1.0" in contents
+
+
+class TestDeduplication:
+    """A requirement reached from several sources is handed to uv once."""
+
+    def test_manifest_dependency_written_once(self, tmp_path):
+        odoo_dir = _make_odoo_dir(tmp_path, "lxml==4.9.3\n")
+        addons = tmp_path / "addons"
+        _make_addon(addons, "mod_a", ["phonenumbers"])
+        _make_addon(addons, "mod_b", ["phonenumbers"])
+        contents = _run_dry(tmp_path, odoo_dir, addons_paths=[str(addons)], install_addons_manifests_requirements=True)
+        assert contents == "lxml==4.9.3\nphonenumbers\n"
+
+    def test_repeated_addons_path_scanned_once(self, tmp_path):
+        odoo_dir = _make_odoo_dir(tmp_path, "")
+        addons = tmp_path / "addons"
+        _make_addon(addons, "mod_a", ["phonenumbers"])
+        (addons / "requirements.txt").write_text("requests\n", encoding="utf-8")
+
+        with patch("odoo_venv.main._find_manifest_files", wraps=_find_manifest_files) as mock_find:
+            contents = _run_dry(
+                tmp_path,
+                odoo_dir,
+                addons_paths=[str(addons), str(addons) + "/."],
+                install_addons_dirs_requirements=True,
+                install_addons_manifests_requirements=True,
+            )
+
+        mock_find.assert_called_once_with([str(addons)])
+        assert contents == "requests\nphonenumbers\n"
@@ -0,0 +1,43 @@
+import subprocess
+import sys
+
+
+def _imported_modules_after(statement: str) -> set[str]:
+    """Run *statement* in a fresh interpreter and return the names in sys.modules."""
+    code = f"import sys; {statement}; print('\\n'.join(sys.modules))"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)  # noqa: S603
+    return set(result.stdout.splitlines())
+
+
+def test_cli_import_defers_heavy_modules():
+    """Importing the CLI (e.g. for --help) must not load the venv-creation stack."""
+    modules = _imported_modules_after("import odoo_venv.cli.main")
+    assert "odoo_venv.main" not in modules
+    assert "odoo_addons_path" not in modules
+    assert "packaging.requirements" not in modules
+    assert "rich.console" not in modules
+    assert "importlib.metadata" not in modules
+    assert "tomllib" not in modules
+
+
+def test_version_fast_path_skips_typer():
+    """`odoo-venv --version` must print the version without building the Typer app."""
+    code = (
+        "import sys; sys.argv = ['odoo-venv', '--version']; "
+        "from odoo_venv.cli import run; run(); "
+        "print('typer' in sys.modules)"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)  # noqa: S603
+    version_line, typer_loaded = result.stdout.splitlines()
+    assert version_line.startswith("odoo-venv ")
+    assert typer_loaded == "False"
+
+
+def test_entry_point_callable_after_cli_module_import():
+    """Importing odoo_venv.cli.main must not shadow the console-script target."""
+    code = (
+        "import sys; sys.argv = ['odoo-venv', '--version']; "
+        "import odoo_venv.cli.main; from odoo_venv.cli import run; run()"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)  # noqa: S603
+    assert result.stdout.startswith("odoo-venv ")
@@ -0,0 +1,22 @@
+import subprocess
+from pathlib import Path
+from unittest.mock import patch
+
+from odoo_venv.main import _install_requirements_with_retry
+
+
+def test_failing_package_dropped_from_stdin_requirements():
+    failure = subprocess.CalledProcessError(1, [], stderr="error: Failed to build `rfc6266-parser==0.0.6`")
+
+    with patch("odoo_venv.main._run_command", side_effect=[failure, None]) as mock_run_command:
+        skipped = _install_requirements_with_retry(
+            "lxml==4.9.3\nrfc6266_parser==0.0.6\nphonenumbers\n", venv_dir=Path(".venv"), verbose=False
+        )
+
+    assert skipped == ["rfc6266-parser"]
+    inputs = [c.kwargs["input_text"] for c in mock_run_command.call_args_list]
+    assert inputs == [
+        "lxml==4.9.3\nrfc6266_parser==0.0.6\nphonenumbers\n",
+        "lxml==4.9.3\nphonenumbers\n",
+    ]
+    assert all(c.args[0] == ["uv", "pip", "install", "-r", "-"] for c in mock_run_command.call_args_list)
@@ -0,0 +1,24 @@
+import os
+
+import pytest
+
+from odoo_venv.launcher import LAUNCHER_DIR, _launcher_dir_on_path
+
+
+@pytest.mark.parametrize(
+    "entry",
+    [
+        str(LAUNCHER_DIR),
+        str(LAUNCHER_DIR) + "/",
+        "~/.local/bin",
+        "~/.local/bin/",
+    ],
+)
+def test_launcher_dir_on_path_accepts_unnormalized_entries(monkeypatch, entry):
+    monkeypatch.setenv("PATH", os.pathsep.join(["/usr/bin", entry]))
+    assert _launcher_dir_on_path()
+
+
+def test_launcher_dir_on_path_rejects_prefix_match(monkeypatch):
+    monkeypatch.setenv("PATH", os.pathsep.join(["/usr/bin", str(LAUNCHER_DIR) + "2"]))
+    assert not _launcher_dir_on_path()
@@ -0,0 +1,58 @@
+import os
+from pathlib import Path
+
+from odoo_venv.main import _find_manifest_files, _read_manifest_external_dependencies
+
+
+def _make_addon(root: Path, rel: str, manifest: str = "{'name': 'x'}") -> Path:
+    addon = root / rel
+    addon.mkdir(parents=True, exist_ok=True)
+    (addon / "__manifest__.py").write_text(manifest, encoding="utf-8")
+    return addon
+
+
+def test_find_manifest_files_prunes_non_addon_subtrees(tmp_path):
+    repo_a = tmp_path / "repo_a"
+    repo_b = tmp_path / "repo_b"
+    _make_addon(repo_a, "mod_a")
+    _make_addon(repo_a, "mod_a/static/lib/vendored")  # inside an addon: not an addon of its own
+    _make_addon(repo_a, ".git/mod_hidden")
+    _make_addon(repo_a, "node_modules/mod_js")
+    _make_addon(repo_b, "nested/mod_b")
+
+    found = _find_manifest_files([str(repo_a), str(repo_b)])
+
+    assert [p.parent.name for p in found] == ["mod_a", "mod_b"]
+
+
+def test_read_manifest_external_dependencies(tmp_path):
+    manifest = (
+        _make_addon(
+            tmp_path,
+            "mod",
+            "{'name': 'Mod', 'data': ['views/a.xml'],"
+            " 'external_dependencies': {'python': ['lxml'], 'bin': ['wkhtmltopdf']}}",
+        )
+        / "__manifest__.py"
+    )
+    assert _read_manifest_external_dependencies(manifest) == {"python": ["lxml"], "bin": ["wkhtmltopdf"]}
+
+    # An edited manifest (new mtime) is re-read rather than served from the cache.
+    mtime_ns = manifest.stat().st_mtime_ns
+    manifest.write_text("{'name': 'Mod'}", encoding="utf-8")
+    os.utime(manifest, ns=(mtime_ns + 1_000_000_000, mtime_ns + 1_000_000_000))
+    assert _read_manifest_external_dependencies(manifest) == {}
+
+
+def test_read_manifest_external_dependencies_indented_manifest(tmp_path):
+    manifest = _make_addon(tmp_path, "mod", "  \t{'name': 'Mod', 'external_dependencies': {'python': ['lxml']}}\n")
+    assert _read_manifest_external_dependencies(manifest / "__manifest__.py") == {"python": ["lxml"]}
+
+
+def test_read_manifest_external_dependencies_last_duplicate_key_wins(tmp_path):
+    manifest = _make_addon(
+        tmp_path,
+        "mod",
+        "{'external_dependencies': {'python': ['old']}, 'name': 'Mod', 'external_dependencies': {'python': ['new']}}",
+    )
+    assert _read_manifest_external_dependencies(manifest / "__manifest__.py") == {"python": ["new"]}
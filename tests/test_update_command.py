@@ -42,7 +42,7 @@ def _create_fake_venv(tmp_path):
 
 class TestUpdateCommand:
     @patch("odoo_venv.cli.main._freeze_venv", return_value={"debugpy": "1.8.0"})
-    @patch("odoo_venv.cli.main.create_odoo_venv")
+    @patch("odoo_venv.main.create_odoo_venv")
     def test_update_basic(self, mock_create, mock_freeze, tmp_path):
         venv_dir = _create_fake_venv(tmp_path)
 
@@ -69,7 +69,7 @@ class TestUpdateCommand:
         assert result.exit_code != 0
 
     @patch("odoo_venv.cli.main._freeze_venv", return_value={"debugpy": "1.8.0"})
-    @patch("odoo_venv.cli.main.create_odoo_venv")
+    @patch("odoo_venv.main.create_odoo_venv")
     def test_update_backup_created(self, mock_create, mock_freeze, tmp_path):
         venv_dir = _create_fake_venv(tmp_path)
 
@@ -85,7 +85,7 @@ class TestUpdateCommand:
         assert bak_path.exists()
 
     @patch("odoo_venv.cli.main._freeze_venv", return_value={"debugpy": "1.8.0"})
-    @patch("odoo_venv.cli.main.create_odoo_venv")
+    @patch("odoo_venv.main.create_odoo_venv")
     def test_update_no_backup(self, mock_create, mock_freeze, tmp_path):
         venv_dir = _create_fake_venv(tmp_path)
 
@@ -101,7 +101,7 @@ class TestUpdateCommand:
         assert not bak_path.exists()
 
     @patch("odoo_venv.cli.main._freeze_venv", return_value={"debugpy": "1.8.0"})
-    @patch("odoo_venv.cli.main.create_odoo_venv")
+    @patch("odoo_venv.main.create_odoo_venv")
     def test_update_user_declines(self, mock_create, mock_freeze, tmp_path):
         venv_dir = _create_fake_venv(tmp_path)
 
@@ -115,7 +115,7 @@ class TestUpdateCommand:
         assert "cancelled" in result.output.lower()
         assert venv_dir.exists()
 
-    @patch("odoo_venv.cli.main.create_odoo_venv", side_effect=RuntimeError("build failed"))
+    @patch("odoo_venv.main.create_odoo_venv", side_effect=RuntimeError("build failed"))
     def test_update_create_failure_cleans_tmp(self, mock_create, tmp_path):
         venv_dir = _create_fake_venv(tmp_path)
         result = runner.invoke(app, ["update", str(venv_dir)])